@@ -11,11 +11,11 @@ major sections after the header:
     2. A list (<array>) of playlists, composed of the IDs of the tracks they
        contain.
 
-This utility first gets the list of tracks as the `all_tracks` variable, accessible
-via ID <key>s. Then it gets the <array> of playlists, and cross references each ID
-against the `all_tracks` DOM object to build the paths to each song for
-the M3U file. It makes one .m3u file for each playlist, placing each in the 
-"Playlist" folder.
+This utility streams through the file once, reading the tracks into the
+`all_tracks` variable, a `dict` accessible via track ID, and the <array> of
+playlists into a `list`. Then it cross references each ID in each playlist
+against `all_tracks` to build the paths to each song for the M3U file. It
+makes one .m3u file for each playlist, placing each in the "Playlist" folder.
 
 This, of course, assumes the music directory you're keeping your music in is
 organized into folders for each artist, with subfolders for each release by
@@ -54,68 +54,314 @@ correct directory structure is there for you to use as you see fit.
 
 import sys
 import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import timezone, datetime
 import traceback
-from lxml import etree
 from itxml2pl.lib import gen_utils, parsers, sanitizers
 from itxml2pl.lib.parsers import Track, Playlist    # I want these classes by name
 
 
+# Everything in a playlist XML before the <PlaylistItems> is the same for every
+# playlist except the timestamp and the title, so it's only laid out once, here.
+# The rest of the fixed markup is kept as bytes too, so only the timestamp,
+# title, and track paths have to be encoded for each playlist.
+_XML_HEAD_TEMPLATE = (
+    b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    b"<Item>\n"
+    b"  <Added>%b</Added>\n"
+    b"  <LockData>false</LockData>\n"
+    b"  <LocalTitle>%b</LocalTitle>\n"
+)
+_XML_ITEMS_OPEN  = b"  <PlaylistItems>\n"
+_XML_ITEMS_CLOSE = b"  </PlaylistItems>\n"
+_XML_ITEMS_EMPTY = b"  <PlaylistItems/>\n"
+_XML_ITEM_OPEN   = b"    <PlaylistItem>\n      <Path>"
+_XML_ITEM_CLOSE  = b"</Path>\n    </PlaylistItem>\n"
+_XML_ITEM_SEP    = _XML_ITEM_CLOSE + _XML_ITEM_OPEN    # between two tracks' paths
+_XML_FOOT        = b"  <Shares/>\n  <PlaylistMediaType>Audio</PlaylistMediaType>\n</Item>\n"
+
+
 def write_xml_playlist(playlist_filepath: str, pl_name: str, track_paths: list, dir_sep: str):
     """
     Writes XML files from playlist info. Some headers are missing,
     like owner user ID, genres, and runtime, but these can be 
     populated by a library scan (relatively brief if already
     done on library as a whole).
+
+    The layout of these files is fixed, so the file is assembled
+    directly as bytes, and written out in one go, instead of building
+    up an element tree only to serialize it right after.
     """
+    added = datetime.now(timezone.utc).strftime("%m/%d/%Y %H:%M:%S")
+
     # sanitize
     pl_name_sanitized = sanitizers.sanitize_xml(pl_name)
-    pl_xml = etree.XML(
-        (
-            "<Item>"
-            "<Added>"
-            f"{datetime.now(timezone.utc).strftime("%m/%d/%Y %H:%M:%S")}"
-            "</Added>"
-            "<LockData>false</LockData>"
-            f"<LocalTitle>{pl_name_sanitized}</LocalTitle>"
-            "<PlaylistItems />"
-            "<Shares />"
-            "<PlaylistMediaType>Audio</PlaylistMediaType>"
-            "</Item>"
-        )
-    )
-    pl_xml_tree = etree.ElementTree(pl_xml)   # for native write() method
-
-    # all playlist items will be appended to this one. Element.find()
-    # returns a reference to the element, not a copy (thank god)
-    pl_items_el = pl_xml_tree.find("PlaylistItems")
 
-    for track_path in track_paths:
+    # fill in the only two fields that change from playlist to playlist
+    pl_xml = bytearray(
+        _XML_HEAD_TEMPLATE % (added.encode('utf-8'), pl_name_sanitized.encode('utf-8'))
+    )
 
-        # build <PlaylistItem> element
-        pl_track     = etree.Element("PlaylistItem")
-        path_el      = etree.SubElement(pl_track, "Path")
-        path_el.text = sanitizers.sanitize_xml(track_path[:-1])    # shave off \n from parse_xml()
+    if track_paths:
+        # build all the <PlaylistItem> elements with a single join
+        pl_xml += _XML_ITEMS_OPEN
+        pl_xml += _XML_ITEM_OPEN
+        pl_xml += _XML_ITEM_SEP.join(
+            [sanitizers.sanitize_xml(track_path).encode('utf-8') for track_path in track_paths]
+        )
+        pl_xml += _XML_ITEM_CLOSE
+        pl_xml += _XML_ITEMS_CLOSE
+    else:
+        pl_xml += _XML_ITEMS_EMPTY
 
-        # append it to <PlaylistItems> element,
-        # which by tr.file_ext adds it to `pl_xml`
-        pl_items_el.append(pl_track)
+    pl_xml += _XML_FOOT
 
     # Jellyfin puts all its playlist XMLs in folders with the name of the playlist,
-    # so create one if need be
-    playlist_parent_dir = playlist_filepath.split(dir_sep)
-    playlist_parent_dir = dir_sep.join(playlist_parent_dir[:-1])
-    os.makedirs(playlist_parent_dir, exist_ok=True)
+    # so create one if need be. Its parent (the playlist's iTunes folder) was
+    # already made by make_parent_folder_path(), so a single mkdir() does it,
+    # without os.makedirs() checking each component of the path first
+    playlist_parent_dir = playlist_filepath.rpartition(dir_sep)[0]
+    try:
+        os.mkdir(playlist_parent_dir)
+    except FileExistsError:
+        pass
 
     # will create file if it doesn't exist
-    pl_xml_tree.write(
-        playlist_filepath,
-        pretty_print=True,
-        xml_declaration=True,
-        encoding='utf-8',
-        standalone=True
+    with open(playlist_filepath, "wb") as pl_file:
+        pl_file.write(pl_xml)
+
+
+
+def resolve_playlist(
+    pl_tracks:   list,
+    all_tracks:  dict,
+    track_index: dict,
+    default_dir: str,
+    music_index: parsers.MusicIndex,
+    cli_opts:    dict,
+    dir_sep:     str) -> tuple[list, set, set]:
+    """
+    Resolves the track items of a playlist into the paths to write to
+    the playlist file, checking each one against the music directory
+    as requested by the user.
+
+    This is the innermost loop of the program, run once per track per
+    playlist, so the values it needs from `cli_opts` are looked up once,
+    up front, rather than per track.
+
+    Returns the paths to write, the set of paths checked for existence,
+    and the set of paths that couldn't be found (each ending with "\n").
+    """
+    music_dir    = cli_opts['music_dir']
+    docker_dir   = cli_opts['docker_dir']
+    check_exists = cli_opts['check_exists']
+
+    track_paths         = []
+    pl_tracks_not_found = set()
+    candidates          = []    # (track, path to check, path to write) for each track
+
+    for tr_item in pl_tracks:
+
+        tr_id = tr_item.get("Track ID")
+        tr    = track_index.get(tr_id)
+
+        if tr is None:
+            tr_info = parsers.lookup_song(tr_item, all_tracks)
+            tr      = Track(tr_info, default_dir)
+            track_index[tr_id] = tr
+
+            # from here on the track is only looked up in track_index, and
+            # the Track doesn't keep its info, so the info can be freed
+            all_tracks.pop(tr_id, None)
+
+        # path to check for file existence; may not be the same as path included in
+        # playlist file if Jellyfin runs in a container.
+        rel_path   = tr.compose_path(dir_sep)
+        check_path = music_dir + rel_path
+
+
+        if docker_dir:
+            path = docker_dir + rel_path
+        else:
+            path = check_path
+
+        candidates.append((tr, check_path, path))
+
+    # check all the playlist's paths against the music directory at once;
+    # only the ones missing from it need any more work below
+    pl_tracks_checked = {check_path for _, check_path, _ in candidates}
+    missing_paths     = pl_tracks_checked - music_index.paths
+
+    # usually every track is where it's expected to be, and
+    # the paths can be taken as they are, in one go
+    if not missing_paths:
+        track_paths = [path for _, _, path in candidates]
+        return track_paths, pl_tracks_checked, pl_tracks_not_found
+
+    for tr, check_path, path in candidates:
+
+        # the index can still miss files the filesystem itself would find
+        # (e.g. on case-insensitive filesystems, like on macOS and Windows),
+        # so ask it directly about the few paths left before searching
+        if check_path in missing_paths and not os.path.exists(check_path):
+
+            # try and find the track, with a fuzzy search
+            corrected_path = parsers.fuzzy_search(check_path,
+                music_dir,
+                dir_sep,
+                music_index,
+                contains=True)
+
+            if corrected_path is None:
+
+                # always track, even when option is "none" (see prints at end of parse_xml())
+                pl_tracks_not_found.add(check_path+"\n")
+
+                # validate filepaths, if requested
+                if check_exists == "warn":
+
+                    print(f"\n{gen_utils.WARNING}: unable to locate file:\n"
+                        f"\t'{tr.name}' by {tr.artist}\n"
+                        f"Expected it at: \"{path}\"\n"
+                        f"{gen_utils.WARNING}: song not added to playlist")
+                    continue
+
+                if check_exists == "error":
+
+                    # don't need to worry about track misses and playlist completion,
+                    # since an error is raised when the first of either occurs
+                    raise FileNotFoundError(f"file {path} not found.")
+            else:
+                path = corrected_path
+
+        # execution reaches here if either:
+        # 1) file exists, OR
+        # 2) check_exists == "none"
+        track_paths.append(path)
+
+    return track_paths, pl_tracks_checked, pl_tracks_not_found
+
+
+
+def convert_playlist(plist: dict, context: dict) -> tuple[str, set, set] | None:
+    """
+    Converts a single playlist, writing its playlist file and its file
+    of missing tracks. `context` holds everything read in by `parse_xml()`
+    that is needed for this, see there.
+
+    Returns the name of the playlist, the set of paths checked for its
+    tracks, and the set of paths that couldn't be found, or `None` if the
+    playlist file already exists and was left alone.
+    """
+    pl         = Playlist(plist)
+    cli_opts   = context['cli_opts']
+    dir_sep    = context['dir_sep']
+    xml_output = context['xml_output']
+    pl_dir     = cli_opts['playlist_dir']
+    pl_folders = context['pl_folders']
+
+    pl_tracks     = pl.info.get("Playlist Items", [])   # list of track IDs
+    pl_filepath   = pl_dir + pl.make_parent_folder_path(pl_folders, pl_dir, dir_sep)
+
+    # determine filepath
+    pl_name_sanitized = sanitizers.sanitize_path(pl.name, "Name")
+    if xml_output:
+        pl_filepath  = dir_sep.join([pl_filepath, pl_name_sanitized, "playlist.xml"])
+    else:
+        pl_filepath += dir_sep + pl_name_sanitized + ".m3u"
+
+    # defaulting to not overwriting existing files.
+    #
+    # I am assuming that if an M3U file of the exact name of the
+    # playlist exists, in the playlist directory specified by the
+    # user, it probably is the way the user wants it. It may even be
+    # from an earlier run of this very program, which may have been
+    # cut short due to an exception raised or simply early termination.
+    #
+    # This requires the user to delete the existing playlist files,
+    # preventing accidental overwrites.
+    if os.path.exists(pl_filepath):
+        if xml_output:
+            print((f"\"{pl.name}/playlist.xml\" exists in "
+                f"{pl_dir}, skipping..."))
+        else:
+            print((f"\"{pl.name}.m3u\" exists in {pl_dir}, skipping..."))
+
+        return None
+
+    track_paths, pl_tracks_checked, pl_tracks_not_found = resolve_playlist(
+        pl_tracks,
+        context['all_tracks'],
+        context['track_index'],
+        context['default_dir'],
+        context['music_index'],
+        cli_opts,
+        dir_sep
     )
 
+    # write out to file, with the correct format
+    if xml_output:
+        write_xml_playlist(pl_filepath, pl.name, track_paths, dir_sep)
+    else:
+        # one encoded write for the whole file, rather than one per line
+        with open(pl_filepath, "wb") as pl_file:
+            if track_paths:
+                pl_file.write(("\n".join(track_paths) + "\n").encode("utf-8"))
+
+    # write out file of missed tracks from the playlist,
+    # in file named <playlist name>/playlist.missing for XMLs
+    # or <playlist name>.m3u.missing for M3Us.
+    if xml_output:
+        missing_tr_file_path  = pl_filepath.rpartition(dir_sep)[0]
+        missing_tr_file_path += dir_sep + "playlist.missing"    # change file tr.file_ext
+    else:
+        missing_tr_file_path  = pl_filepath + ".missing"        # append after file tr.file_ext
+
+    # NOTE: since a `set` was used to keep track of missing tracks,
+    # the order these tracks will be written to this file cannot be
+    # known in advance.
+    with open(missing_tr_file_path, "wb") as missing_tr_file:
+        missing_tr_file.write("".join(pl_tracks_not_found).encode("utf-8"))
+
+    return pl.name, pl_tracks_checked, pl_tracks_not_found
+
+
+
+# the context for converting playlists in a worker process, and the
+# event that tells workers to stop, see _init_worker()
+_worker_context = None
+_worker_stop    = None
+
+def _init_worker(context: dict, stop_event):
+    """
+    Runs once in each worker process when it starts, so the (potentially
+    large) context is sent to each worker once, rather than with every
+    playlist. `stop_event` is shared by all the workers, see
+    `_convert_in_worker()`.
+    """
+    global _worker_context, _worker_stop
+    _worker_context = context
+    _worker_stop    = stop_event
+
+
+def _convert_in_worker(plist: dict) -> tuple[str, set, set] | None:
+    """
+    Once any playlist has raised an error (e.g. a missing track with
+    `-c error`), the run is going to end on it, so the playlists
+    that workers haven't started on yet are skipped.
+    """
+    if _worker_stop.is_set():
+        return None
+
+    try:
+        return convert_playlist(plist, _worker_context)
+    except BaseException:
+        _worker_stop.set()
+        raise
+
 
 
 def parse_xml(cli_opts: dict):
@@ -139,39 +385,42 @@ def parse_xml(cli_opts: dict):
 
     print("Loading library XML file...\n")
     try:
-        library_dom = etree.parse(cli_opts['xml_file'])
+        default_dir, all_tracks, playlists = parsers.load_library(cli_opts['xml_file'])
     except OSError as ose:
         print(f"Unable to find Library.xml file at {cli_opts['xml_file']}.")
         print(f"Error text: {repr(ose)}")
         raise OSError from ose
 
-    # directory given in the Library.xml
-    default_dir = library_dom.xpath("dict/key[text()='Music Folder']/following-sibling::string[1]")[0].text
-    all_tracks  = library_dom.find("dict/dict")             # keep tracks as a single <dict> element
-    playlists   = library_dom.findall("dict/array/dict")    # Playlists == <dict>s, list for iter
+    # default_dir is the directory given in the Library.xml
     pl_folders  = parsers.get_pl_folders(playlists)         # the playlists folders made in iTunes
 
+    if cli_opts['music_dir']:
+        print("Scanning music directory...\n")
+    music_index = parsers.MusicIndex(cli_opts['music_dir'], dir_sep)
+
     # vars for loading bar
     total_playlists  = len(playlists)        # includes folders, will update as folders are found
-    proc_start       = datetime.now()
+    proc_start       = time.monotonic_ns()
 
     # "Playlists" that are all/most of the library, and are not user-generated.
-    pl_ignores       = ["Library", "Downloaded", "Music", "Recently Added"]
-    total_playlists -= len(pl_ignores)                      # decrement by list length above
+    # (a frozenset, since it's only ever checked for membership)
+    pl_ignores       = frozenset(("Library", "Downloaded", "Music", "Recently Added"))
+    total_playlists -= len(pl_ignores)                      # decrement by number of ignored names above
 
     # Create playlist directory if it doesn't exist
-    os.makedirs(pl_dir, exist_ok=True)
+    parsers.ensure_dir(pl_dir)
 
     # track missing tracks and altered playlists
     all_tracks_in_pls    = set()
     all_tracks_not_found = set()    # count only unique misses
     incomplete_playlists = []
+    pls_to_convert       = []
 
     #########
-    # Iterate over playlists
+    # Pick out the playlists to convert
     #########
     print("Starting conversion...\n")
-    for i, plist in enumerate(playlists):
+    for plist in playlists:
 
         pl = Playlist(plist)
 
@@ -183,143 +432,82 @@ def parse_xml(cli_opts: dict):
             total_playlists -= 1    # number originally included folders, adjust that here
             continue
 
-        pl_incomplete = False
-        pl_tracks     = pl.el.findall("array/dict")     # list of track IDs
-        pl_filepath   = pl_dir + pl.make_parent_folder_path(pl_folders, pl_dir, dir_sep)
-        track_paths   = []
-
-        pl_tracks_not_found = set()
-
-        # determine filepath
-        pl_name_sanitized = sanitizers.sanitize_path(pl.name, "Name")
-        if xml_output:
-            pl_filepath  = dir_sep.join([pl_filepath, pl_name_sanitized, "playlist.xml"])
-        else:
-            pl_filepath += dir_sep + pl_name_sanitized + ".m3u"
-
-        # defaulting to not overwriting existing files.
-        #
-        # I am assuming that if an M3U file of the exact name of the
-        # playlist exists, in the playlist directory specified by the
-        # user, it probably is the way the user wants it. It may even be
-        # from an earlier run of this very program, which may have been
-        # cut short due to an exception raised or simply early termination.
-        #
-        # This requires the user to delete the existing playlist files,
-        # preventing accidental overwrites.
-        if os.path.exists(pl_filepath):
-            if xml_output:
-                print((f"\"{pl.name}/playlist.xml\" exists in "
-                    f"{pl_dir}, skipping..."))
-            else:
-                print((f"\"{pl.name}.m3u\" exists in {pl_dir}, skipping..."))
-
-            continue
-
-        #########
-        # Iterate over tracks of playlist
-        #########
-        for tr_id_el in pl_tracks:
-
-            tr_el = parsers.lookup_song(tr_id_el, all_tracks)
-            tr    = Track(tr_el, default_dir)
-
-            # path to check for file existence; may not be the same as path included in
-            # playlist file if Jellyfin runs in a container.
-            rel_path   = tr.compose_path(dir_sep)
-            check_path = cli_opts['music_dir'] + rel_path
-
-
-            if cli_opts['docker_dir']:
-                path = cli_opts['docker_dir'] + rel_path
-            else:
-                path = check_path
-
-
-            all_tracks_in_pls.add(check_path)             # count unique tracks encountered
-
-            if not os.path.exists(check_path):
-
-                # try and find the track, with a fuzzy search
-                corrected_path = parsers.fuzzy_search(check_path,
-                    cli_opts['music_dir'],
-                    dir_sep,
-                    contains=True)
-
-                if not os.path.exists(corrected_path):
-
-                    # always track, even when option is "none" (see prints at end of function)
-                    if not corrected_path:
-                        pl_tracks_not_found.add(check_path+"\n")          # add original path to set
-                        all_tracks_not_found.add(check_path+"\n")
-                    else:
-                        pl_tracks_not_found.add(corrected_path+"\n")      # add failed correction
-                        all_tracks_not_found.add(corrected_path+"\n")
-
-                    pl_incomplete = True
-
-                    # validate filepaths, if requested
-                    if cli_opts['check_exists'] == "warn":
-
-                        print("\n\033[0;33mWarning\033[0m: unable to locate file:")
-                        print(f"\t'{tr.name}' by {tr.artist}")
-                        print(f"Expected it at: \"{path}\"")
-                        print("\033[0;33mWarning\033[0m: song not added to playlist")
-                        continue
-
-                    if cli_opts['check_exists'] == "error":
+        pls_to_convert.append(plist)
+
+    # everything needed to convert a playlist; see convert_playlist().
+    #
+    # 'track_index' holds Track objects by track ID, so each track's info is
+    # only parsed once, no matter how many playlists it's in. It's filled in
+    # as tracks are met, rather than up front, since most of the library may
+    # not be in any playlist that gets converted.
+    context = {
+        'all_tracks':  all_tracks,
+        'track_index': dict(),
+        'default_dir': default_dir,
+        'music_index': music_index,
+        'pl_folders':  pl_folders,
+        'cli_opts':    cli_opts,
+        'dir_sep':     dir_sep,
+        'xml_output':  xml_output,
+    }
 
-                        # don't need to worry about track misses and playlist completion,
-                        # since an error is raised when the first of either occurs
-                        raise FileNotFoundError(f"file {path} not found.")
-                else:
-                    path = corrected_path
+    # Playlists are independent of each other once the library and music
+    # directory have been read, so they can be shared out among worker
+    # processes. Each worker gets `context` once, when it starts.
+    jobs = cli_opts['jobs']
+    if jobs > 1:
+        stop_event = multiprocessing.Event()
+        executor   = ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(context, stop_event)
+        )
+        # a few chunks per worker, so that even a handful of
+        # playlists is spread out over all of them
+        chunksize  = max(1, len(pls_to_convert) // (jobs * 4))
+        results    = executor.map(_convert_in_worker, pls_to_convert, chunksize=chunksize)
+    else:
+        executor   = nullcontext()
+        results    = (convert_playlist(plist, context) for plist in pls_to_convert)
 
-            # execution reaches here if either:
-            # 1) file exists, OR
-            # 2) check_exists == "none"
-            track_paths.append(path+"\n")
+    with executor:
+        try:
+            for i, result in enumerate(results):
 
-        if pl_incomplete:
-            incomplete_playlists.append(pl.name+"\n")
+                # playlist file already existed
+                if result is None:
+                    continue
 
-        # write out to file, with the correct format
-        if xml_output:
-            write_xml_playlist(pl_filepath, pl.name, track_paths, dir_sep)
-        else:
-            with open(pl_filepath, "w+", encoding='utf-8') as pl_file:
-                pl_file.writelines(track_paths)
+                pl_name, pl_tracks_checked, pl_tracks_not_found = result
 
-        # write out file of missed tracks from the playlist,
-        # in file named <playlist name>/playlist.missing for XMLs
-        # or <playlist name>.m3u.missing for M3Us.
-        missing_tr_file_path = pl_filepath.split(dir_sep)
-        if xml_output:
-            missing_tr_file_path[-1]  = "playlist.missing"  # change file tr.file_ext
-        else:
-            missing_tr_file_path[-1] += ".missing"          # append after file tr.file_ext
+                all_tracks_in_pls    |= pl_tracks_checked           # count unique tracks encountered
+                all_tracks_not_found |= pl_tracks_not_found
 
-        missing_tr_file_path = dir_sep.join(missing_tr_file_path)
+                if pl_tracks_not_found:
+                    incomplete_playlists.append(pl_name+"\n")
 
-        # NOTE: since a `set` was used to keep track of missing tracks,
-        # the order these tracks will be written to this file cannot be
-        # known in advance.
-        with open(missing_tr_file_path, "w+", encoding='utf-8') as missing_tr_file:
-            missing_tr_file.writelines(pl_tracks_not_found)
+                gen_utils.print_progress_bar(i+1, total_playlists, proc_start)
 
-        gen_utils.print_progress_bar(i+1, total_playlists, proc_start)
+        except BaseException:
+            # leaving the `with` block waits for every playlist still queued
+            # up to be converted, so drop those first; e.g. with `-c error`
+            # the run should stop at the first missing track, like with one process
+            if jobs > 1:
+                stop_event.set()
+                executor.shutdown(cancel_futures=True)
+            raise
 
     # make list of playlists that had any missing tracks, named
     # named "00incomplete_playlists.txt" in the given playlist directory
-    with open(pl_dir+"00incomplete_playlists.txt", "w+", encoding='utf-8') as incomp_pl_file:
-        incomp_pl_file.writelines(incomplete_playlists)
+    with open(pl_dir+"00incomplete_playlists.txt", "wb") as incomp_pl_file:
+        incomp_pl_file.write("".join(incomplete_playlists).encode("utf-8"))
 
     # make list of all filepaths for songs that weren't found,
     # and put it in the playlist directory root. Uses M3U format
     # regardless of playlist format to help user better locate
     # missing tracks
-    with open(pl_dir+"00tracks_not_found.m3u", "w+", encoding='utf-8') as tr_not_found_file:
-        tr_not_found_file.writelines(all_tracks_not_found)
+    with open(pl_dir+"00tracks_not_found.m3u", "wb") as tr_not_found_file:
+        tr_not_found_file.write("".join(all_tracks_not_found).encode("utf-8"))
 
     # print this regardless
     # "tracks not found" measures the number of tracks that are in playlists,
@@ -343,7 +531,8 @@ def main():
         docker_dir:        "",
         output_format:     "xml",
         use_dos_filepaths: False,
-        show_ext_map:      False
+        show_ext_map:      False,
+        jobs:              1
     }
     """
 
@@ -364,19 +553,19 @@ def main():
 
         except FileNotFoundError as fnfe:
 
-            print(f"\033[0;31mError\033[0m: {repr(fnfe)}")
-            print(("\033[0;33mNote\033[0m: this error can be thrown if the file exists, "
+            print(f"{gen_utils.ERROR}: {repr(fnfe)}")
+            print((f"{gen_utils.NOTE}: this error can be thrown if the file exists, "
                 "but was given the wrong tr.file_ext by this program. To display the way "
                 "this program maps file types to tr.file_exts, execute the program "
                 "with the -t flag.\n"))
             print(("If you would like the program to continue running even when a music "
                 "file is not found, execute the program with either `-c warn` or `-c none`.\n"))
-            print("\033[0;31mTerminating on error...\033[0m")
+            print(gen_utils.TERMINATING)
 
             sys.exit(2)     # Linux ENOENT exit status
         except PermissionError as pe:
 
-            print(f"\033[0;31mError\033[0m: {repr(pe)}")
+            print(f"{gen_utils.ERROR}: {repr(pe)}")
 
             # see what the permissions are
             music_dir_stat = os.stat(cli_opts['music_dir'])
@@ -394,18 +583,18 @@ def main():
             print(f"    Owner: {pl_dir_stat.st_uid}")
             print(f"     Mode: {pl_dir_stat.st_mode}")
 
-            print("\n\033[0;31mTerminating on error...\033[0m")
+            print(f"\n{gen_utils.TERMINATING}")
 
         except OSError:
             sys.exit(2)
 
         except Exception as e:
-            print(f"\033[0;31mUnexpected error encountered\033[0m: {repr(e)}")
+            print(f"{gen_utils.UNEXPECTED}: {repr(e)}")
             traceback.print_exc()
-            print("\033[0;31mTerminating on error...\033[0m")
+            print(gen_utils.TERMINATING)
             sys.exit(1)
 
-    print("\n\n\033[0;32mConversion complete!\033[0m\n")
+    print(f"\n\n{gen_utils.COMPLETE}\n")
 
 
 # if __name__ == "__main__":
@@ -1,8 +1,44 @@
 from argparse import ArgumentParser
 import json
 import shutil
+import signal
+import sys
+import threading
+import time
 from math import ceil
-from datetime import datetime
+
+# Colored labels for messages. Color codes only make sense on a terminal,
+# so they're left out when output is redirected to a file or a pipe.
+_USE_COLOR = sys.stdout.isatty()
+
+def _colorize(text: str, color_code: str) -> str:
+    if _USE_COLOR:
+        return f"\033[{color_code}m{text}\033[0m"
+    return text
+
+WARNING     = _colorize("Warning", "0;33")
+NOTE        = _colorize("Note", "0;33")
+ERROR       = _colorize("Error", "0;31")
+UNEXPECTED  = _colorize("Unexpected error encountered", "0;31")
+TERMINATING = _colorize("Terminating on error...", "0;31")
+COMPLETE    = _colorize("Conversion complete!", "0;32")
+
+# The progress bar is redrawn after every playlist, so the terminal width
+# is kept here instead of being asked for on every call, and is only
+# refreshed when the terminal is actually resized (SIGWINCH, POSIX only;
+# see _watch_term_width()).
+#
+# The bar itself is only built when the width changes; each redraw then
+# just slices off as much of it as is needed.
+_term_width  = shutil.get_terminal_size(fallback=(80,25))[0]
+_full_bar    = "█" * (_term_width-37)
+_blank_bar   = " " * (_term_width-37)
+_last_redraw = 0                # time.monotonic_ns() of the last redraw
+_REDRAW_INTERVAL = 1_000_000_000 // 30    # nanoseconds; no need to redraw faster than ~30 Hz
+_width_watched   = None         # whether SIGWINCH keeps _term_width current; set on the first redraw
+
+# the command line can't change while running, so it only needs parsing once
+_cli_args = None
 
 def parse_cli_args() -> dict:
     """
@@ -42,11 +78,22 @@ def parse_cli_args() -> dict:
                             scanned already).
     -w, --dos-filepaths   Use MSDOS (Windows) filepath conventions (backslash file
                             separator)
+    -j, --jobs JOBS       Number of processes to convert playlists with. Defaults to 1.
+                            With more than 1, warnings from different playlists may be
+                            printed out of order.
     --debug               Don't catch any errors; allow Python to crash so it will display
                             the stack trace.
     -t, --ext-map         Show mapping of file types to file extensions used in the program
                             and exit.
+
+    The arguments are only parsed on the first call; later calls get a copy
+    of the same result, which the caller is free to change.
     """
+    global _cli_args
+
+    if _cli_args is not None:
+        return dict(_cli_args)
+
     ap = ArgumentParser(
         description="A simple utility to generate playlist files from an iTunes / Apple Music's \
             exported Library file (XML), tailored to Jellyfin's playlist format.\n\
@@ -130,6 +177,16 @@ def parse_cli_args() -> dict:
                         (backslash file separator)"
         )
 
+    ap.add_argument('-j', '--jobs',
+                    default=1,
+                    type=int,
+                    required=False,
+                    dest="jobs",
+                    help="Number of processes to convert playlists with. Defaults \
+                        to 1. With more than 1, warnings from different playlists \
+                        may be printed out of order."
+        )
+
     ap.add_argument('-t', '--ext-map',
                     action="store_true",
                     default=False,
@@ -155,7 +212,12 @@ def parse_cli_args() -> dict:
     if not cli_args['music_dir']:
         cli_args['check_exists'] = "none"
 
-    return cli_args
+    # there's always at least the one process
+    cli_args['jobs'] = max(cli_args['jobs'], 1)
+
+    _cli_args = cli_args
+
+    return dict(cli_args)
 
 
 def show_ext_map(fe_map: dict):
@@ -182,30 +244,84 @@ def ensure_slash(opts: dict) -> dict:
     path_args = ['playlist_dir', 'music_dir', 'docker_dir']
 
     for arg in path_args:
-        if not opts[arg]:
-            continue
-        if opts[arg][-1] != fp_slash:
-            opts[arg] += fp_slash
+        path = opts[arg]
+
+        # empty paths are left empty
+        if path and not path.endswith(fp_slash):
+            opts[arg] = path + fp_slash
 
     return opts
 
-def print_progress_bar(rows_now: int, total_rows: int, func_start_time: datetime):
+def _refresh_term_width(*_):
+    """
+    Signal handler for SIGWINCH; gets the new width of the terminal,
+    and rebuilds the bar strings to match.
+    """
+    global _term_width, _full_bar, _blank_bar
+    _term_width = shutil.get_terminal_size(fallback=(80,25))[0]
+    _full_bar   = "█" * (_term_width-37)
+    _blank_bar  = " " * (_term_width-37)
+
+
+def _watch_term_width() -> bool:
+    """
+    Installs `_refresh_term_width()` as the SIGWINCH handler, and returns
+    whether it could. This is done on the first redraw of the progress bar,
+    not on import, and only when it's safe to: Python only allows it from
+    the main thread, and a handler something else already installed is
+    left alone.
+    """
+    if not hasattr(signal, "SIGWINCH"):
+        return False
+
+    if threading.current_thread() is not threading.main_thread():
+        return False
+
+    if signal.getsignal(signal.SIGWINCH) is not signal.SIG_DFL:
+        return False
+
+    signal.signal(signal.SIGWINCH, _refresh_term_width)
+
+    return True
+
+
+
+def print_progress_bar(rows_now: int, total_rows: int, func_start_ns: int):
     """
     Print progress bar, adjusting for console width.
+
+    `func_start_ns` is a `time.monotonic_ns()` timestamp, so all the time
+    math here is done on integers. Calls that come in less than
+    `_REDRAW_INTERVAL` after the last redraw are skipped, except for the
+    last row, so the bar always ends up complete.
     """
+    global _last_redraw, _width_watched
+
     rows_now = min(rows_now, total_rows)   # cap rows_now
 
-    output_width  = shutil.get_terminal_size(fallback=(80,25))[0]-37   # adjust as terminal changes
+    now = time.monotonic_ns()
+    if rows_now != total_rows and now - _last_redraw < _REDRAW_INTERVAL:
+        return
+    _last_redraw = now
+
+    # without a SIGWINCH handler, the width is checked on every redraw instead
+    if _width_watched is None:
+        _width_watched = _watch_term_width()
+        _refresh_term_width()
+    elif not _width_watched:
+        _refresh_term_width()
+
+    output_width  = _term_width-37          # adjust as terminal changes
     completion    = rows_now/total_rows
     bar_width_now = ceil(output_width * completion)
 
-    since_start   = datetime.now() - func_start_time
-    est_remaining = since_start * (total_rows/rows_now - 1)
-    minutes       = int(est_remaining.total_seconds()) // 60
-    seconds       = est_remaining.seconds % 60   # `seconds` attribute can have value > 60
+    since_start   = now - func_start_ns
+    est_remaining = since_start * (total_rows - rows_now) // rows_now // 1_000_000_000   # in seconds
+    minutes       = est_remaining // 60
+    seconds       = est_remaining % 60
 
-    print("\r| ", "█" * bar_width_now,
-            (output_width - bar_width_now) * " ", "|",
+    print("\r| ", _full_bar[:bar_width_now],
+            _blank_bar[bar_width_now:], "|",
             f"{completion:.0%}  ",
             f"Time remaining: {minutes:02d}:{seconds:02d}",
             end = "\r")
@@ -5,22 +5,146 @@ Library.xml file produced by iTunes when you export
 your library.
 """
 import os
+import sys
 import urllib.parse as url
 import importlib.resources as mod_data
 import json
-from lxml import etree
+import unicodedata
+from functools import lru_cache
+from typing import TYPE_CHECKING
 import itxml2pl
 from itxml2pl.lib.sanitizers import sanitize_path
+from itxml2pl.lib.gen_utils import WARNING
+
+# The XML parser is only needed once the library file is actually read, so
+# it is imported in load_library(); `-h` and `-t` never pay for loading it.
+if TYPE_CHECKING:
+    from xml.etree import ElementTree as etree
 
 # file is located at (with repo as root): /itxml2pl/src/itxml2pl/file-ext.json
 json_str = mod_data.files(itxml2pl) / "file-ext.json"
 FILE_EXT_MAP = json.load(json_str.open())
 
+# Playlist folders are shared by many playlists, so the path to each folder
+# is only worked out once (keyed by folder ID and dir_sep), and each folder
+# is only created on disk once. See Playlist.make_parent_folder_path() and
+# ensure_dir().
+_FOLDER_PATHS = {}
+_MADE_DIRS    = set()
+
 ########################
 # STANDALONE FUNCTIONS #
 ########################
 
-def get_pl_folders(playlists: etree.ElementBase) -> dict:
+def load_library(xml_path: str) -> tuple[str, dict, list]:
+    """
+    Streams through the Library.xml file once, pulling out only the
+    parts of it this program uses:
+
+        1. the "Music Folder" URI,
+        2. the tracks <dict>, as a `dict` of Track ID to track info, and
+        3. the playlists <array>, as a `list` of playlist info.
+
+    Each track and playlist is converted into plain Python objects (see
+    `_plist_value()`) as soon as its element is closed, and the element
+    is freed right after, so the full DOM of the library is never held
+    in memory at once. For large libraries, that DOM can be several
+    times the size of the file itself.
+
+    The standard library's (C-accelerated) ElementTree is used for this.
+    `plistlib` would do the same conversion in one call, but it parses
+    every value in the file, dates and all, and measured noticeably slower
+    than streaming through just the parts needed here.
+    """
+    from xml.etree import ElementTree as etree
+
+    music_folder = ""
+    tracks       = dict()
+    playlists    = list()
+    section      = None     # text of the last top-level <key> read
+    track_id     = None
+    depth        = 0        # <plist> is at depth 1, its <dict> at depth 2
+    open_els     = []       # elements opened but not yet closed; ElementTree
+                            # elements don't know their parents
+
+    for event, el in etree.iterparse(xml_path, events=("start", "end")):
+
+        if event == "start":
+            depth += 1
+            open_els.append(el)
+            continue
+
+        open_els.pop()
+
+        # direct children of the top-level <dict>: section names and
+        # their values. The Tracks <dict> and Playlists <array> are
+        # already emptied by the time they close, see below.
+        if depth == 3:
+            if el.tag == "key":
+                section = el.text
+            elif section == "Music Folder":
+                music_folder = el.text
+
+        # children of the Tracks <dict> (<key>/<dict> pairs), and of the
+        # Playlists <array> (one <dict> per playlist)
+        elif depth == 4:
+            if section == "Tracks":
+                if el.tag == "key":
+                    track_id = int(el.text)
+                else:
+                    tracks[track_id] = _plist_value(el)
+
+            elif section == "Playlists":
+                playlists.append(_plist_value(el))
+
+        # anything deeper is read when its depth-4 ancestor closes, so it
+        # can't be freed yet. Earlier siblings were already removed, so
+        # this is always the first child of its parent.
+        if depth <= 4:
+            el.clear()
+            if open_els:
+                open_els[-1].remove(el)
+
+        depth -= 1
+
+    return music_folder, tracks, playlists
+
+
+
+def _plist_value(el: "etree.Element"):
+    """
+    Converts a plist element into the equivalent Python object:
+    <dict>s become `dict`s (keyed by the text of their <key>s), <array>s
+    become `list`s, <integer>s become `int`s, and <true/>/<false/> become
+    `bool`s. Everything else (<string>, <date>, etc.) is kept as text.
+
+    The same couple dozen <key>s show up in every track, so they're
+    interned, leaving one copy of each instead of one per track.
+    """
+    tag = el.tag
+
+    if tag == "dict":
+        # children alternate between <key> and value elements
+        children = iter(el)
+        return {sys.intern(key.text): _plist_value(next(children)) for key in children}
+
+    if tag == "array":
+        return [_plist_value(child) for child in el]
+
+    if tag == "integer":
+        return int(el.text)
+
+    if tag == "true":
+        return True
+
+    if tag == "false":
+        return False
+
+    return el.text or ""
+
+
+
+def get_pl_folders(playlists: list) -> dict:
     """
     Scans the list of playlists, and assembles a `dict` where each 
     key-value pair following form:
@@ -31,48 +155,81 @@ def get_pl_folders(playlists: etree.ElementBase) -> dict:
     to save time and computing resources later on. 
     
     It was thought to be more effecient than passing the whole (potentially 
-    large) XML element down a chain of recursion, and instead passing a `dict`
-    down it. 
+    large) list of playlists down a chain of recursion, and instead passing
+    a `dict` down it. 
     """
 
     pl_dict = dict()
     for pl in playlists:
 
-        p = Playlist(pl)
-
-        if not p.is_folder():
+        # check for the "Folder" key before building a whole Playlist,
+        # since most playlists aren't folders (same test as Playlist.is_folder())
+        if "Folder" not in pl:
             continue
 
-        pl_dict.update({p.id: (p.name, p.parent_id)})
+        p = Playlist(pl)
+        pl_dict[p.id] = (p.name, p.parent_id)
 
     return pl_dict
 
 
 
-def lookup_song(track_id_el: etree.ElementBase, 
-                tracks_el: etree.ElementBase) -> etree.ElementBase | None:
+def ensure_dir(dir_path: str):
     """
-    Uses a track ID element from a playlist to get the song info
-    out of the all-tracks element.
+    Creates a directory (and any missing parents), unless it was already
+    made by this function. `os.makedirs()` stats the path even when it
+    exists, so this saves a syscall for every playlist after the first
+    in the same folder.
     """
-    track_id = track_id_el.find("integer")
+    if dir_path in _MADE_DIRS:
+        return
+
+    os.makedirs(dir_path, exist_ok=True)
+    _MADE_DIRS.add(dir_path)
+
+
+
+def lookup_song(track_item: dict, tracks: dict) -> dict | None:
+    """
+    Uses a track item from a playlist to get the song info
+    out of the all-tracks `dict`.
+    """
+    track_id = track_item.get("Track ID")
     if track_id is None:
         return None
-    
-    track = tracks_el.xpath(f"key[text()='{track_id.text}']/following-sibling::dict[1]")[0]
 
-    return track
+    return tracks[track_id]
 
 
 
-def fuzzy_search(track_path: str, music_dir: str, dir_sep: str, contains=False) -> str:
+@lru_cache(maxsize=1<<16)
+def fold_name(name: str) -> str:
+    """
+    The form of a file or directory name used to compare names regardless
+    of case in `fuzzy_search()`: NFKC-normalized and case-folded. This 
+    catches more than `str.lower()` does, like "ß" vs. "SS", and names 
+    with accents that were saved decomposed (as macOS tends to do) vs.
+    precomposed (as they usually are in the library file).
+    """
+    return unicodedata.normalize("NFKC", name).casefold()
+
+
+
+def fuzzy_search(
+    track_path:  str,
+    music_dir:   str,
+    dir_sep:     str,
+    music_index: "MusicIndex",
+    contains=False) -> str | None:
     """
     Descend along the track path, returning the correct path if found. 
 
-    track_path: the path to the track file that has not yet been found
-    music_dir:  the path to the Music root directory
-    dir_sep:    the OS-appropriate directory separator
-    contiains:  allow matches to simply contain the current entry string 
+    track_path:  the path to the track file that has not yet been found
+    music_dir:   the path to the Music root directory
+    dir_sep:     the OS-appropriate directory separator
+    music_index: the `MusicIndex` of the Music root directory, used in place
+                 of the filesystem itself
+    contiains:   allow matches to simply contain the current entry string 
                 (e.g. "greatest" will match "Greatest Hits"). still accounts 
                 for differences in capitalization.
 
@@ -121,50 +278,86 @@ def fuzzy_search(track_path: str, music_dir: str, dir_sep: str, contains=False)
         return "/Music/Jane Shepard/Greatest Hits/Renegade.ogg:
         ```
     
+    ("Lowercase" here is really `fold_name()`, which also evens out
+    differences in Unicode normalization.)
+
     If the path cannot be located with any case switchup, then it will return 
-    a null string.
+    `None`. Every entry of a path that is returned has been found in `music_index`,
+    so there's no need to check it again.
     """
     rel_tp   = track_path.replace(music_dir, "")    # remove music dir path
 
     # For he sake of clarity, I am referring to each directory along a path,
     # as well as the name of the file to which it points, as "entries".
-    # So `tp_parts` here is a `list` of entries.
-    tp_parts = rel_tp.split(dir_sep)
+    # The directory part of the path is shared by every track on the same
+    # album, so it's only fixed once (per run), and kept in `music_index`.
+    rel_dir, _, file_name = rel_tp.rpartition(dir_sep)
+    dir_key = (rel_dir, dir_sep, contains)
 
-    fixed_path = music_dir
+    if dir_key in music_index.fixed_dirs:
+        fixed_path = music_index.fixed_dirs[dir_key]
+    else:
+        fixed_path = music_dir
 
-    for tp_entry in tp_parts:
+        if rel_dir:
+            for tp_entry in rel_dir.split(dir_sep):
+                fixed_path += _fix_entry(fixed_path, tp_entry, music_index, contains) + dir_sep
 
-        # no need to check through all entries in directory if the next track_path
-        # part already exists
-        if os.path.exists(fixed_path+tp_entry):
-            fixed_path += tp_entry + dir_sep
-            continue
+                # if the best directory to append to the fixed path still isn't
+                # one that exists, we're not finding the file
+                if not music_index.is_dir(fixed_path):
+                    fixed_path = None
+                    break
+
+        music_index.fixed_dirs[dir_key] = fixed_path
 
-        lc_tp_entry     = tp_entry.lower()
-        best_dir_to_add = tp_entry         # either the correct dir or simply from the original path
-        curr_dir        = os.listdir(fixed_path)
+    if fixed_path is None:
+        return None
 
-        for dir_entry in curr_dir:
-            lc_de = dir_entry.lower()
+    # likewise for the file itself, except files are only
+    # in the index as paths, not as directories
+    fixed_path += _fix_entry(fixed_path, file_name, music_index, contains)
 
-            if lc_de == lc_tp_entry:
-                best_dir_to_add = dir_entry     # will result in some redundant assignments
+    if fixed_path not in music_index:
+        return None
 
-            if lc_tp_entry in lc_de and contains:
-                best_dir_to_add = dir_entry
+    return fixed_path
 
-        fixed_path += best_dir_to_add + dir_sep
 
-        # if the best directory to append to the fixed path last loop still isn't one that
-        # exists, we're not finding the file; return ""
-        if not os.path.exists(fixed_path):
-            return ""
 
-    # loop adds trailing dir_sep, remove
-    fixed_path = fixed_path[:-1]
+def _fix_entry(
+    fixed_path:  str,
+    tp_entry:    str,
+    music_index: "MusicIndex",
+    contains:    bool) -> str:
+    """
+    One step of `fuzzy_search()`: gives the name of the entry in directory
+    `fixed_path` that best matches `tp_entry`, or `tp_entry` itself if
+    nothing better turns up. Whether that entry exists (as a directory or
+    a file, whichever is wanted) is left to the caller.
+    """
 
-    return fixed_path
+    # no need to check through all entries in directory if the next track_path
+    # part already exists
+    if fixed_path + tp_entry in music_index:
+        return tp_entry
+
+    lc_tp_entry = fold_name(tp_entry)
+
+    # an exact match (other than case) is as good as it gets, and
+    # can be looked up directly
+    best_entry = music_index.match_folded(fixed_path, lc_tp_entry)
+
+    if best_entry is None:
+        best_entry = tp_entry   # either the correct entry or simply from the original path
+
+        # only substring matches need the whole directory searched
+        if contains:
+            for dir_entry, lc_de in music_index.listdir_folded(fixed_path):
+                if lc_tp_entry in lc_de:
+                    best_entry = dir_entry
+
+    return best_entry
 
 
 
@@ -172,22 +365,152 @@ def fuzzy_search(track_path: str, music_dir: str, dir_sep: str, contains=False)
 #        CLASSES       #
 ########################
 
+class MusicIndex:
+    """
+    A snapshot of everything in the music directory, taken once with
+    `os.scandir()` before any playlists are converted. Checking whether
+    a track's file exists is then a `set` lookup, instead of a `stat`
+    syscall for every track in every playlist, and `fuzzy_search()` reads
+    its directory listings from here instead of listing the same 
+    directories over and over.
+
+    Paths are stored the same way they're built in `parse_xml()`: the
+    music directory, followed by the entries along the path joined
+    by `dir_sep`. Directories are listed under their path with a trailing
+    `dir_sep`, like the music directory itself.
+    """
+    def __init__(self, music_dir: str, dir_sep: str):
+        self.paths           = set()    # every file and directory, no trailing dir_sep
+        self.listings        = dict()   # directory path -> names of its entries
+        self.folded_listings = dict()   # directory path -> (name, folded name) pairs,
+                                        # filled in as fuzzy_search() asks for them
+        self.folded_names    = dict()   # directory path -> {folded name: name}, likewise
+        self.fixed_dirs      = dict()   # directory part of a track path -> what fuzzy_search()
+                                        # fixed it to (or None), see there
+
+        # without a music directory, track paths are relative, and there's
+        # no telling what to; leave the index empty
+        if music_dir:
+            self._scan(music_dir, dir_sep)
+
+
+    def _scan(self, music_dir: str, dir_sep: str):
+        """
+        Walks the music directory depth-first, following symlinks to
+        directories, since `os.path.exists()` follows them too (and music
+        libraries are often pieced together with them). Each directory is
+        only scanned once, going by its device and inode numbers, so a
+        symlink loop can't send it around in circles.
+        """
+        dirs_to_scan = [music_dir]
+        scanned_dirs = set()    # (st_dev, st_ino) of each directory scanned
+
+        while dirs_to_scan:
+            dir_path = dirs_to_scan.pop()
+            entry_names = []
+
+            try:
+                dir_stat = os.stat(dir_path)
+                dir_key  = (dir_stat.st_dev, dir_stat.st_ino)
+
+                if dir_key in scanned_dirs:
+                    continue
+                scanned_dirs.add(dir_key)
+
+                dir_entries = os.scandir(dir_path)
+            except PermissionError:
+                # unreadable subdirectories are left out of the index, so their
+                # contents are treated as missing; the music directory itself
+                # needs to be readable, though
+                if dir_path == music_dir:
+                    raise
+                continue
+
+            with dir_entries:
+                for entry in dir_entries:
+                    entry_path = dir_path + entry.name
+                    entry_names.append(entry.name)
+                    self.paths.add(entry_path)
+
+                    if entry.is_dir():
+                        dirs_to_scan.append(entry_path + dir_sep)
+
+            self.listings[dir_path] = entry_names
+
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.paths
+
+
+    def is_dir(self, path: str) -> bool:
+        """
+        Whether `path` (with a trailing `dir_sep`) is a directory
+        in the index.
+        """
+        return path in self.listings
+
+
+    def listdir(self, path: str) -> list:
+        """
+        Names of the entries in directory `path` (with a trailing `dir_sep`),
+        like `os.listdir()`. Empty if the directory isn't in the index.
+        """
+        return self.listings.get(path, [])
+
+
+    def listdir_folded(self, path: str) -> list:
+        """
+        Like `listdir()`, but gives (name, folded name) pairs (see
+        `fold_name()`). Every track on an album that needs fixing searches
+        the same directories, so each listing is only folded once.
+        """
+        folded_listing = self.folded_listings.get(path)
+
+        if folded_listing is None:
+            folded_listing = [(name, fold_name(name)) for name in self.listdir(path)]
+            self.folded_listings[path] = folded_listing
+
+        return folded_listing
+
+
+    def match_folded(self, path: str, folded_name: str) -> str | None:
+        """
+        The name of the entry in directory `path` that is `folded_name`
+        when folded, or `None` if there isn't one. If more than one entry
+        fits, the first one listed is given.
+        """
+        folded_map = self.folded_names.get(path)
+
+        if folded_map is None:
+            folded_map = dict()
+            for name, folded in self.listdir_folded(path):
+                folded_map.setdefault(folded, name)
+            self.folded_names[path] = folded_map
+
+        return folded_map.get(folded_name)
+
+
+
 class _LibraryEntry:
     """
     Base class for both Track and Playlist.
+
+    These are made for every track in every converted playlist, so
+    they use `__slots__` instead of a `__dict__` per instance.
     """
-    def __init__(self, el: etree.ElementBase):
-        self.el   = el
+    __slots__ = ("info", "name")
+
+    def __init__(self, info: dict):
+        self.info = info
         self.name = self.get_str_attr("Name", False)
 
     def get_str_attr(self, attr: str, path_sanitize=True):
         """
         Get any attribute of the song or playlist held in a <string> element. 
         
-        It works by getting the next <string> element after the <key> 
-        that has `attr` for its text content. This returns a `list` 
-        of 1 element. The text attribute of this <string> element 
-        object is the attr info.
+        The info `dict` is keyed by the text content of each <key>, so
+        this is the value stored under `attr`, as long as it was a
+        <string> in the library file.
 
         Directory seperator is added to be able to sanitize the return value, 
         in case it gets used in a filepath.
@@ -196,40 +519,50 @@ class _LibraryEntry:
         `path_sanitize`: Whether to replace problematic characters in 
             an attribute value with `_`. Defaults to `True`.
 
+        The same artist, album, and file type strings come up over and 
+        over across a library, so the result is interned, and all tracks
+        with the same value share one copy of it.
         """
 
-        # get first <string> element after a <key> with
-        # text content of `attr`
-        string_el_list = self.el.xpath(f"key[text()='{attr}']/following-sibling::string[1]")
+        result = self.info.get(attr)
+
+        # trim off spaces from end and beginning
+        if isinstance(result, str):
+            result = result.strip()
 
-        # if the attr is missing, and happens to be Artist or Album,
-        # it cannot be null. Otherwise it can be.
-        if not string_el_list:
+        # if the attr is missing (or empty, like <string></string>), and
+        # happens to be Artist or Album, it cannot be null. Otherwise it can be.
+        if not isinstance(result, str) or not result:
             if attr == "Album":
                 return "Unknown Album"
 
             return ""
 
-        # trim off spaces from end and beginning
-        result = string_el_list[0].text
-        result = result.lstrip().rstrip()
-
         if path_sanitize:
-            return sanitize_path(result, attr)
+            result = sanitize_path(result, attr)
 
-        return result
+        return sys.intern(result)
 
 
 
 
 class Track(_LibraryEntry):
     """
-    Wrapper class for functions to parse Track `etree.ElementBase`s
-    out of the `Library.xml` file.
+    Wrapper class for functions to parse the track info `dict`s
+    read out of the `Library.xml` file.
     """
-    def __init__(self, song_el: etree.ElementBase, music_folder_from_file: str):
+    __slots__ = ("rel_path", "artist", "album", "track_num", "artist_dir", "file_ext")
+
+    # this is the priority by which the artist directory is determined
+    _ARTIST_DIR_ATTRS = ("Sort Album Artist", "Album Artist", "Sort Artist")
+
+    # artist directories already worked out, keyed by the values of the
+    # attributes above (as in the library file) and the track artist
+    _artist_dirs = dict()
+
+    def __init__(self, song: dict, music_folder_from_file: str):
 
-        super().__init__(song_el)
+        super().__init__(song)
         self.name       = sanitize_path(self.name, "Name")
         self.rel_path   = self._get_rel_path(music_folder_from_file)
         self.artist     = self.get_str_attr("Artist")
@@ -238,14 +571,18 @@ class Track(_LibraryEntry):
         self.artist_dir = self._get_artist_dir()
         self.file_ext   = self._get_file_ext()
 
+        # everything needed from the track info has been read by now,
+        # and Tracks are kept around for the whole run, so let it go
+        self.info       = None
+
 
     def _get_rel_path(self, default_dir: str) -> str | None:
-        location = self.el.xpath("key[text()='Location']/following-sibling::string[1]")
+        location = self.info.get("Location")
         
-        if not len(location):
+        if not location:
             return None
         
-        rel_path_uri = location[0].text.replace(default_dir, "")
+        rel_path_uri = location.replace(default_dir, "")
 
         # the <Location> value is is given in the XML in URI format
         rel_path = sanitize_path(url.unquote(rel_path_uri), "Location")
@@ -266,26 +603,22 @@ class Track(_LibraryEntry):
         track_number = ""
 
         # check for multi-disc album
-        disc_count = self.el.xpath("key[text()='Disc Count']/following-sibling::integer[1]")
+        disc_count = self.info.get("Disc Count")
 
         if disc_count:
-            if int(disc_count[0].text) > 1:
-                disc_num = self.el.xpath("key[text()='Disc Number']/following-sibling::integer[1]")
+            if disc_count > 1:
+                disc_num = self.info.get("Disc Number")
 
                 # sometimes tracks have a disc count, but no listed disc number
-                if len(disc_num) > 0:
-                    track_number = disc_num[0].text + "-"
+                if disc_num is not None:
+                    track_number = str(disc_num) + "-"
 
-        # list returned
-        tr_num = self.el.xpath("key[text()='Track Number']/following-sibling::integer[1]")
+        tr_num = self.info.get("Track Number")
 
-        if len(tr_num) > 0:
+        if tr_num is not None:
 
             # we're only padding to a width of 2, so it's simple to implement here
-            if len(tr_num[0].text) == 1:
-                track_number += "0" + tr_num[0].text + " "
-            else:
-                track_number += tr_num[0].text + " "       # space added for formatting
+            track_number += f"{tr_num:02d} "       # space added for formatting
 
         return track_number
 
@@ -293,16 +626,17 @@ class Track(_LibraryEntry):
     def _get_file_ext(self) -> str:
         """
         Get file extension given file type.
+
+        The Kind is only ever looked up in `FILE_EXT_MAP`, never put
+        in a path, so it doesn't need to be path-sanitized.
         """
-        file_type = self.get_str_attr("Kind")
-        file_ext  = None
+        file_type = self.get_str_attr("Kind", path_sanitize=False)
+        file_ext  = FILE_EXT_MAP.get(file_type)
 
-        if file_type in FILE_EXT_MAP.keys():
-            file_ext = FILE_EXT_MAP[file_type]
-        else:
-            print("\033[0;33mWarning\033[0m: unable to determine file extention for:")
-            print(f"\t'{self.name}' by {self.artist}")
-            print("\033[0;33mWarning\033[0m: song not added to playlist")
+        if file_ext is None:
+            print(f"{WARNING}: unable to determine file extention for:\n"
+                f"\t'{self.name}' by {self.artist}\n"
+                f"{WARNING}: song not added to playlist")
 
         return file_ext
 
@@ -319,19 +653,33 @@ class Track(_LibraryEntry):
         4. "Unknown Artist"
 
         This function returns the proper value for the track element.
+        Every track on an album almost always comes out the same, so
+        results are remembered by the attribute values they came from.
         """
 
-        compil_elem  = self.el.xpath("key[text()='Compilation']")
-
         # when a track is a part of a compilation
-        if compil_elem:
+        if "Compilation" in self.info:
             return "Compilations"
 
-        # this is the priority by which the artist directory is determined
-        priority_attrs = ["Sort Album Artist", "Album Artist", "Sort Artist"]
+        info    = self.info
+        dir_key = (*map(info.get, self._ARTIST_DIR_ATTRS), self.artist)
+
+        artist_dir = self._artist_dirs.get(dir_key)
+
+        if artist_dir is None:
+            artist_dir = self._pick_artist_dir()
+            self._artist_dirs[dir_key] = artist_dir
+
+        return artist_dir
+
+
+    def _pick_artist_dir(self) -> str:
+        """
+        The uncached part of `_get_artist_dir()`.
+        """
 
         # search for and return the first match in the priority list
-        for attr in priority_attrs:
+        for attr in self._ARTIST_DIR_ATTRS:
 
             val = self.get_str_attr(attr)
 
@@ -351,10 +699,15 @@ class Track(_LibraryEntry):
     
 
     def compose_path(self, dir_sep: str) -> str:
+        """
+        Path to the track, relative to the music directory. Built with
+        a single f-string, which sizes and fills the result in one go,
+        rather than a `list`, a join, and a concatenation.
+        """
         if self.rel_path:
             return self.rel_path
         
-        return dir_sep.join([self.artist_dir, self.album, self.track_num + self.name]) #+ self.file_ext
+        return f"{self.artist_dir}{dir_sep}{self.album}{dir_sep}{self.track_num}{self.name}" #+ self.file_ext
 
 
 
@@ -365,12 +718,14 @@ class Playlist(_LibraryEntry):
 
     While it would seem intuitive to have `Playlist` objects
     composed of a set of `Track` objects, the conversion
-    adds little over simply processing the `etree.ElementBase` object
+    adds little over simply processing the list of track items
     directly, and in fact would add a lot of overhead for this
     application.
     """
-    def __init__(self, pl_el: etree.ElementBase):
-        super().__init__(pl_el)
+    __slots__ = ("id", "parent_id")
+
+    def __init__(self, pl_info: dict):
+        super().__init__(pl_info)
         self.id         = self.get_str_attr("Playlist Persistent ID", False)
         self.parent_id  = self.get_str_attr("Parent Persistent ID", False)      # parent ID
 
@@ -379,11 +734,9 @@ class Playlist(_LibraryEntry):
         """
         Check whether the playlist is a folder or not.
         """
-        results = self.el.xpath("key[text()='Folder']")
-
         # playlists that are not folders do not have a <key>
         # with "Folder" for its text content.
-        return (len(results) > 0)
+        return "Folder" in self.info
 
 
     def make_parent_folder_path(
@@ -404,13 +757,19 @@ class Playlist(_LibraryEntry):
         the user specified. It also create the directories necessary
         in the playlist directory
 
-        It does this through recursion. See parent_folder() for recursive 
-        componenent.
+        It does this by walking up the folder table, see _parent_folder().
+        Paths already worked out for a folder, and directories
+        already made, are remembered, since most playlists share their
+        parent folder with others.
         """
-        path_so_far  = ""
-        parents_path = self._parent_folder(self.parent_id, playlist_folders, path_so_far, dir_sep)
+        folder_key   = (self.parent_id, dir_sep)
+        parents_path = _FOLDER_PATHS.get(folder_key)
+
+        if parents_path is None:
+            parents_path = self._parent_folder(self.parent_id, playlist_folders, dir_sep)
+            _FOLDER_PATHS[folder_key] = parents_path
 
-        os.makedirs(playlist_dir+parents_path, exist_ok=True)
+        ensure_dir(playlist_dir + parents_path)
 
         return parents_path
 
@@ -419,18 +778,23 @@ class Playlist(_LibraryEntry):
         self,
         pl_parent_id:  str,
         folders_table: dict,
-        path_so_far:   str,
         dir_sep:       str) -> str:
         """
-        Recurses through playlist folder table to get the path from
+        Walks up the playlist folder table to get the path from
         playlist directory to the playlist, as it is organized in iTunes.
+
+        Folder names are collected from the innermost folder outward,
+        and joined once at the end.
         """
+        folder_names = []
+
+        while pl_parent_id:
+            folder_name, pl_parent_id = folders_table[pl_parent_id]
+            folder_names.append(folder_name)
 
-        # break condition
-        if not pl_parent_id:
-            return path_so_far
+        if not folder_names:
+            return ""
 
-        parent_info  = folders_table[pl_parent_id]
-        path_so_far  = parent_info[0] + dir_sep + path_so_far
+        folder_names.reverse()
 
-        return self._parent_folder(parent_info[1], folders_table, path_so_far, dir_sep)
+        return dir_sep.join(folder_names) + dir_sep